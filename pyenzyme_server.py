@@ -1,12 +1,23 @@
+import hashlib
 import os
+import shutil
+import tempfile
+import threading
 
-from fastapi import FastAPI, UploadFile, File, Request, Body
-from starlette.responses import FileResponse, JSONResponse, HTMLResponse
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from fastapi import FastAPI, UploadFile, File, Form, Request, Body
+from fastapi.exceptions import RequestValidationError
+from starlette.responses import FileResponse, JSONResponse, HTMLResponse, Response
 from starlette.background import BackgroundTasks
+from starlette.concurrency import run_in_threadpool
 from fastapi.templating import Jinja2Templates
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from pyenzymedepfix.enzymeml.core.enzymemldocument import EnzymeMLDocument
 from pyenzymedepfix.enzymeml.core.measurement import Measurement
+from pyenzymedepfix.enzymeml.core.utils import deepcopy_enzmldoc
 from pyenzymedepfix.enzymeml.tools.validator import EnzymeMLValidator
 from pyenzymedepfix.utils.rest_examples import create_full_example
 from pyenzymedepfix.enzymeml.core.exceptions import (
@@ -29,11 +40,144 @@ templates = Jinja2Templates(directory="static")
 
 # * Functions
 
+# Uploads are copied to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Uploads are stored under unique names in a directory that is created once
+UPLOAD_DIR = os.path.join(tempfile.gettempdir(), "pyenzyme_uploads")
+os.makedirs(UPLOAD_DIR, exist_ok=True)
+
+# Generated documents are written to per-request directories below this one
+OUTPUT_DIR = os.path.join(tempfile.gettempdir(), "pyenzyme_outputs")
+os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+# Parsed EnzymeML documents and their archive sizes by SHA-256 of the uploaded archive.
+# The cache is bounded by entries and by the summed archive size, larger uploads are not cached.
+DOCUMENT_CACHE_SIZE = 32
+DOCUMENT_CACHE_MAX_BYTES = int(
+    os.environ.get("PYENZYME_DOCUMENT_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+)
+document_cache: "OrderedDict[str, Tuple[int, EnzymeMLDocument]]" = OrderedDict()
+document_cache_bytes = 0
+document_cache_lock = threading.Lock()
+
 
 def remove_file(path: str) -> None:
     os.unlink(path)
 
 
+def remove_directory(path: str) -> None:
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def write_enzmldoc(enzmldoc: EnzymeMLDocument, name: Optional[str] = None) -> str:
+    """Writes an EnzymeML document to a new output directory and returns the OMEX path"""
+
+    dirpath = tempfile.mkdtemp(dir=OUTPUT_DIR)
+    file_name = f"{(name or enzmldoc.name).replace(' ', '_')}.omex"
+
+    try:
+        enzmldoc.toFile(dirpath, name=name)
+    except BaseException:
+        remove_directory(dirpath)
+        raise
+
+    return os.path.join(dirpath, file_name)
+
+
+def save_upload(upload: UploadFile) -> str:
+    """Streams an uploaded file to a new temporary file and returns its path.
+
+    The extension of the uploaded file is kept, since the readers depend on it.
+    """
+
+    suffix = os.path.splitext(upload.filename or "")[1]
+
+    with tempfile.NamedTemporaryFile(
+        dir=UPLOAD_DIR, suffix=suffix, delete=False
+    ) as file_handle:
+        try:
+            shutil.copyfileobj(upload.file, file_handle, length=UPLOAD_CHUNK_SIZE)
+        except BaseException:
+            file_handle.close()
+            os.unlink(file_handle.name)
+            raise
+
+    return file_handle.name
+
+
+def hash_upload(upload: UploadFile) -> Tuple[str, int]:
+    """Returns the SHA-256 hex digest and the size in bytes of an uploaded file and rewinds it"""
+
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in iter(lambda: upload.file.read(UPLOAD_CHUNK_SIZE), b""):
+        digest.update(chunk)
+        size += len(chunk)
+
+    upload.file.seek(0)
+
+    return digest.hexdigest(), size
+
+
+def cache_document(digest: str, size: int, enzmldoc: EnzymeMLDocument) -> None:
+    """Adds a parsed document to the cache and evicts the least recently used ones beyond the limits"""
+
+    global document_cache_bytes
+
+    if size > DOCUMENT_CACHE_MAX_BYTES:
+        return
+
+    with document_cache_lock:
+        if digest in document_cache:
+            return
+
+        document_cache[digest] = (size, enzmldoc)
+        document_cache_bytes += size
+
+        while (
+            len(document_cache) > DOCUMENT_CACHE_SIZE
+            or document_cache_bytes > DOCUMENT_CACHE_MAX_BYTES
+        ):
+            evicted_size, _ = document_cache.popitem(last=False)[1]
+            document_cache_bytes -= evicted_size
+
+
+def read_upload(upload: UploadFile) -> EnzymeMLDocument:
+    """Reads an uploaded OMEX archive to an EnzymeML document.
+
+    Documents are cached by the content of the archive, such that repeated
+    uploads of the same archive are not parsed again. Each call returns a
+    copy, which can be modified freely. The call blocks, run it in the
+    threadpool from async endpoints.
+    """
+
+    digest, size = hash_upload(upload)
+
+    with document_cache_lock:
+        cached = document_cache.get(digest)
+        if cached is not None:
+            document_cache.move_to_end(digest)
+
+    if cached is not None:
+        return deepcopy_enzmldoc(cached[1])
+
+    file_name = save_upload(upload)
+
+    try:
+        enzmldoc = EnzymeMLDocument.fromFile(file_name)
+    finally:
+        remove_file(file_name)
+
+    # Documents with attached files are not cached to not keep their file handles alive
+    if size > DOCUMENT_CACHE_MAX_BYTES or enzmldoc.file_dict:
+        return enzmldoc
+
+    cache_document(digest, size, deepcopy_enzmldoc(enzmldoc))
+
+    return enzmldoc
+
+
 # ! Basic operations
 
 
@@ -52,22 +196,12 @@ async def create_EnzymeML(
     nu_enzmldoc = EnzymeMLDocument.fromJSON(enzmldoc.json())
 
     # Write the new EnzymeML file
-    dirpath = "."
-    file_name = f"{nu_enzmldoc.name.replace(' ', '_')}.omex"
-    file_path = os.path.join(dirpath, file_name)
-
-    nu_enzmldoc.toFile(dirpath, name=nu_enzmldoc.name)
-
-    try:
-        response = FileResponse(file_path, filename=file_name)
-
-        return response
+    file_path = await run_in_threadpool(
+        write_enzmldoc, nu_enzmldoc, name=nu_enzmldoc.name
+    )
+    background_tasks.add_task(remove_directory, path=os.path.dirname(file_path))
 
-    except Exception as e:
-        raise
-
-    finally:
-        background_tasks.add_task(remove_file, path=file_name)
+    return FileResponse(file_path, filename=os.path.basename(file_path))
 
 
 def parse_measurement_data(measurement, key, nu_measurement, enzmldoc):
@@ -89,29 +223,20 @@ def parse_measurement_data(measurement, key, nu_measurement, enzmldoc):
     tags=["Databases"],
 )
 async def upload_to_dataverse(
-    background_tasks: BackgroundTasks,
     dataverse_name: str,
     api_token: str,
     base_url: str,
     omex_archive: UploadFile = File(...),
 ):
 
-    # Write to file
-    file_name = omex_archive.filename
-    content = await omex_archive.read()
-    with open(file_name, "wb") as file_handle:
-        file_handle.write(content)
-
     # Read EnzymeML document
     try:
-        enzmldoc = EnzymeMLDocument.fromFile(file_name)
+        enzmldoc = await run_in_threadpool(read_upload, omex_archive)
         enzmldoc.uploadToDataverse(
             dataverse_name=dataverse_name, base_url=base_url, api_token=api_token
         )
     except Exception as e:
         return f"{e.__class__.__name__}: {str(e)}"
-    finally:
-        background_tasks.add_task(remove_file, path=file_name)
 
 
 @app.post(
@@ -119,20 +244,13 @@ async def upload_to_dataverse(
     summary="Reads an EnzymeML document served in an OMEX archive to a JSON representation",
     description="Use this endpoint as form-data and specify the document to be uploaded via the key 'omex_archive' for a succesfull request.",
     tags=["Basic operations"],
+    response_model=Union[Dict[str, Any], str],
 )
-async def read_enzymeml(
-    background_tasks: BackgroundTasks, omex_archive: UploadFile = File(...)
-):
-
-    # Write to file
-    file_name = omex_archive.filename
-    content = await omex_archive.read()
-    with open(file_name, "wb") as file_handle:
-        file_handle.write(content)
+async def read_enzymeml(omex_archive: UploadFile = File(...)):
 
     # Read EnzymeML document
     try:
-        enzmldoc = EnzymeMLDocument.fromFile(file_name)
+        enzmldoc = await run_in_threadpool(read_upload, omex_archive)
         return enzmldoc.dict(
             exclude_none=True,
             exclude={
@@ -145,8 +263,79 @@ async def read_enzymeml(
         )
     except Exception as e:
         return f"{e.__class__.__name__}: {str(e)}"
-    finally:
-        background_tasks.add_task(remove_file, path=file_name)
+
+
+class DataProjection(BaseModel):
+    """Selection of measurements and species to export from a document"""
+
+    measurement_ids: Union[str, List[str]] = "all"
+    species_ids: Union[str, List[str]] = "all"
+
+
+class ExportedMeasurement(BaseModel):
+    """Data columns and initial concentrations of an exported measurement"""
+
+    data: Dict[str, List[Optional[float]]]
+    initConc: Dict[str, Tuple[float, str]]
+
+
+def export_projections(
+    enzmldoc: EnzymeMLDocument, projections: List[DataProjection]
+) -> List[Dict[str, Dict[str, Any]]]:
+    """Exports the measurement data of a document once per projection"""
+
+    results = []
+    for projection in projections:
+        measurement_data = enzmldoc.exportMeasurementData(
+            measurement_ids=projection.measurement_ids,
+            species_ids=projection.species_ids,
+        )
+
+        results.append(
+            {
+                measurement_id: {
+                    "data": data["data"].to_dict(orient="list"),
+                    "initConc": data["initConc"],
+                }
+                for measurement_id, data in measurement_data.items()
+            }
+        )
+
+    return results
+
+
+# Projections are sent as a JSON form field next to the archive and validated here
+data_projections_adapter = TypeAdapter(Union[DataProjection, List[DataProjection]])
+
+
+@app.post(
+    "/export_data",
+    summary="Exports measurement data of an EnzymeML document for one or more selections of measurements and species",
+    description="Use this endpoint as form-data and specify the document via the key 'omex_archive' and the selections as a JSON object or list via the key 'projections'. The document is read once for all given projections. Returns a list with one entry per projection in the given order, each mapping measurement IDs to the data columns and initial concentrations.",
+    tags=["Basic operations"],
+    response_model=Union[List[Dict[str, ExportedMeasurement]], str],
+)
+async def export_data(
+    projections: str = Form(...),
+    omex_archive: UploadFile = File(...),
+):
+
+    # Validate the projections before reading the document
+    try:
+        projection_list = data_projections_adapter.validate_json(projections)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False))
+
+    if isinstance(projection_list, DataProjection):
+        projection_list = [projection_list]
+
+    # Read EnzymeML document once for all projections
+    try:
+        enzmldoc = await run_in_threadpool(read_upload, omex_archive)
+    except Exception as e:
+        return f"{e.__class__.__name__}: {str(e)}"
+
+    return await run_in_threadpool(export_projections, enzmldoc, projection_list)
 
 
 # ! Modifications
@@ -171,33 +360,22 @@ async def add_Measurement(
                 "error": f"Key '{key}' is not valid for species dict. Please use either 'reactants' or 'proteins'"
             }
 
-    # Write to file
-    file_name = omex_archive.filename
-    content = await omex_archive.read()
-    with open(file_name, "wb") as file_handle:
-        file_handle.write(content)
-
     # Read EnzymeML document
-    enzmldoc = EnzymeMLDocument.fromFile(file_name)
+    enzmldoc = await run_in_threadpool(read_upload, omex_archive)
 
     # Add the measurement
     enzmldoc.addMeasurement(measurement)
 
     # Write the new EnzymeML file
     try:
-        dirpath = "."
-        file_name = f"{enzmldoc.name.replace(' ', '_')}.omex"
-        file_path = os.path.join(dirpath, file_name)
-
-        enzmldoc.toFile(dirpath)
-
-        return FileResponse(file_path, filename=file_name)
+        file_path = await run_in_threadpool(write_enzmldoc, enzmldoc)
 
     except Exception as e:
         return str(e)
 
-    finally:
-        background_tasks.add_task(remove_file, path=file_name)
+    background_tasks.add_task(remove_directory, path=os.path.dirname(file_path))
+
+    return FileResponse(file_path, filename=os.path.basename(file_path))
 
 
 # ! TEMPLATE
@@ -234,36 +412,30 @@ async def convert_template(
 ):
 
     # Write to file
-    file_name = enzymeml_template.filename
-    content = await enzymeml_template.read()
-    with open(file_name, "wb") as file_handle:
-        file_handle.write(content)
+    file_name = await run_in_threadpool(save_upload, enzymeml_template)
 
     # Generate the new EnzymeML file
     try:
-        enzmldoc = EnzymeMLDocument.fromTemplate(file_name)
+        enzmldoc = await run_in_threadpool(
+            EnzymeMLDocument.fromTemplate, file_name
+        )
 
     except Exception as e:
         return str(e)
 
     finally:
-        background_tasks.add_task(remove_file, path=file_name)
+        remove_file(file_name)
 
     # Write the new EnzymeML file
     try:
-        dirpath = "."
-        enzml_name = f"{enzmldoc.name.replace(' ', '_')}.omex"
-        file_path = os.path.join(dirpath, enzml_name)
-
-        enzmldoc.toFile(dirpath)
-
-        return FileResponse(file_path, filename=enzml_name)
+        file_path = await run_in_threadpool(write_enzmldoc, enzmldoc)
 
     except Exception as e:
         return str(e)
 
-    finally:
-        background_tasks.add_task(remove_file, path=enzml_name)
+    background_tasks.add_task(remove_directory, path=os.path.dirname(file_path))
+
+    return FileResponse(file_path, filename=os.path.basename(file_path))
 
 
 # ! Validation
@@ -296,33 +468,30 @@ def upload_validation_template(request: Request):
     summary="Convert the EnzymeML Validation template to a YAML template to use for validation on server site.",
     tags=["EnzymeML Validation"],
 )
-async def convert_validation_template(
-    background_tasks: BackgroundTasks, validation_template: UploadFile = File(...)
-):
+async def convert_validation_template(validation_template: UploadFile = File(...)):
 
     # Write to file
-    file_name = validation_template.filename
-    content = await validation_template.read()
-    with open(file_name, "wb") as file_handle:
-        file_handle.write(content)
+    file_name = await run_in_threadpool(save_upload, validation_template)
 
-    # Generate the new EnzymeML file
+    # Generate the YAML template, which is returned without touching the disk
     try:
-        EnzymeMLValidator.convertSheetToYAML(
-            path=file_name,
-            filename="validation",
+        yaml_string = await run_in_threadpool(
+            EnzymeMLValidator.convertSheetToYAML, path=file_name
         )
 
-        return FileResponse(
-            "validation.yaml", filename="EnzymeML_Validation_Template.yaml"
+        return Response(
+            content=yaml_string,
+            media_type="application/x-yaml",
+            headers={
+                "Content-Disposition": 'attachment; filename="EnzymeML_Validation_Template.yaml"'
+            },
         )
 
     except Exception as e:
         return str(e)
 
     finally:
-        background_tasks.add_task(remove_file, path=file_name)
-        background_tasks.add_task(remove_file, path="validation.yaml")
+        remove_file(file_name)
 
 
 @app.post(
@@ -331,38 +500,28 @@ async def convert_validation_template(
     tags=["EnzymeML Validation"],
 )
 async def validate_enzymeml(
-    background_tasks: BackgroundTasks,
     omex_archive: UploadFile = File(...),
     validation_template: UploadFile = File(...),
 ):
 
-    # Write EnzymeML to file
-    omex_name = omex_archive.filename
-    content = await omex_archive.read()
-    with open(omex_name, "wb") as file_handle:
-        file_handle.write(content)
-
     # Read EnzymeML document
     try:
-        enzmldoc = EnzymeMLDocument.fromFile(omex_name)
+        enzmldoc = await run_in_threadpool(read_upload, omex_archive)
     except Exception as e:
         return f"{e.__class__.__name__}: {str(e)}"
-    finally:
-        background_tasks.add_task(remove_file, path=omex_name)
 
     # Write YAML to file
-    valid_name = validation_template.filename
-    content = await validation_template.read()
-    with open(valid_name, "wb") as file_handle:
-        file_handle.write(content)
+    valid_name = await run_in_threadpool(save_upload, validation_template)
 
     # Read YAML and validate accordingly
     try:
-        report, is_valid = enzmldoc.validateDocument(yaml_path=valid_name)
+        report, is_valid = await run_in_threadpool(
+            enzmldoc.validateDocument, yaml_path=valid_name
+        )
 
         return {"is_valid": is_valid, "report": report}
     finally:
-        background_tasks.add_task(remove_file, path=valid_name)
+        remove_file(valid_name)
 
 
 # * Exception handlers
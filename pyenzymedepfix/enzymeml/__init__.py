@@ -4,15 +4,60 @@
 # License: BSD-2 clause
 # Copyright (c) 2022 Institute of Biochemistry and Technical Biochemistry Stuttgart
 
-from pyenzymedepfix.enzymeml.core import EnzymeMLDocument
-from pyenzymedepfix.enzymeml.core import Creator
-from pyenzymedepfix.enzymeml.core import Vessel
-from pyenzymedepfix.enzymeml.core import Protein
-from pyenzymedepfix.enzymeml.core import Complex
-from pyenzymedepfix.enzymeml.core import Reactant
-from pyenzymedepfix.enzymeml.core import EnzymeReaction
-from pyenzymedepfix.enzymeml.core import Measurement
-from pyenzymedepfix.enzymeml.core import Replicate
-from pyenzymedepfix.enzymeml.core import SBOTerm, DataTypes
-
-from pyenzymedepfix.enzymeml import models
+import importlib
+
+__all__ = [
+    "EnzymeMLDocument",
+    "Creator",
+    "Vessel",
+    "Protein",
+    "Complex",
+    "Reactant",
+    "EnzymeReaction",
+    "Measurement",
+    "Replicate",
+    "SBOTerm",
+    "DataTypes",
+    "core",
+    "models",
+    "tools",
+]
+
+_LAZY_OBJECTS = {
+    "EnzymeMLDocument": "pyenzymedepfix.enzymeml.core",
+    "Creator": "pyenzymedepfix.enzymeml.core",
+    "Vessel": "pyenzymedepfix.enzymeml.core",
+    "Protein": "pyenzymedepfix.enzymeml.core",
+    "Complex": "pyenzymedepfix.enzymeml.core",
+    "Reactant": "pyenzymedepfix.enzymeml.core",
+    "EnzymeReaction": "pyenzymedepfix.enzymeml.core",
+    "Measurement": "pyenzymedepfix.enzymeml.core",
+    "Replicate": "pyenzymedepfix.enzymeml.core",
+    "SBOTerm": "pyenzymedepfix.enzymeml.core",
+    "DataTypes": "pyenzymedepfix.enzymeml.core",
+}
+
+_LAZY_MODULES = {
+    "core": "pyenzymedepfix.enzymeml.core",
+    "models": "pyenzymedepfix.enzymeml.models",
+    "tools": "pyenzymedepfix.enzymeml.tools",
+}
+
+
+def __getattr__(name):
+    """Imports exported objects on first access to keep the package import light"""
+
+    if name in _LAZY_MODULES:
+        value = importlib.import_module(_LAZY_MODULES[name])
+    elif name in _LAZY_OBJECTS:
+        value = getattr(importlib.import_module(_LAZY_OBJECTS[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_OBJECTS) | set(_LAZY_MODULES))
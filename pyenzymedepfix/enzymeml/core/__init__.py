@@ -4,16 +4,55 @@
 # License: BSD-2 clause
 # Copyright (c) 2022 Institute of Biochemistry and Technical Biochemistry Stuttgart
 
-from pyenzymedepfix.enzymeml.core.creator import Creator
-from pyenzymedepfix.enzymeml.core.enzymemldocument import EnzymeMLDocument
-from pyenzymedepfix.enzymeml.core.protein import Protein
-from pyenzymedepfix.enzymeml.core.complex import Complex
-from pyenzymedepfix.enzymeml.core.reactant import Reactant
-from pyenzymedepfix.enzymeml.core.replicate import Replicate
-from pyenzymedepfix.enzymeml.core.unitdef import UnitDef
-from pyenzymedepfix.enzymeml.core.vessel import Vessel
-from pyenzymedepfix.enzymeml.core.enzymereaction import EnzymeReaction
-from pyenzymedepfix.enzymeml.core.enzymemlbase import EnzymeMLBase
-from pyenzymedepfix.enzymeml.core.measurementData import MeasurementData
-from pyenzymedepfix.enzymeml.core.measurement import Measurement
-from pyenzymedepfix.enzymeml.core.ontology import SBOTerm, DataTypes
+import importlib
+
+__all__ = [
+    "Creator",
+    "EnzymeMLDocument",
+    "Protein",
+    "Complex",
+    "Reactant",
+    "Replicate",
+    "UnitDef",
+    "Vessel",
+    "EnzymeReaction",
+    "EnzymeMLBase",
+    "MeasurementData",
+    "Measurement",
+    "SBOTerm",
+    "DataTypes",
+]
+
+_LAZY_OBJECTS = {
+    "Creator": "pyenzymedepfix.enzymeml.core.creator",
+    "EnzymeMLDocument": "pyenzymedepfix.enzymeml.core.enzymemldocument",
+    "Protein": "pyenzymedepfix.enzymeml.core.protein",
+    "Complex": "pyenzymedepfix.enzymeml.core.complex",
+    "Reactant": "pyenzymedepfix.enzymeml.core.reactant",
+    "Replicate": "pyenzymedepfix.enzymeml.core.replicate",
+    "UnitDef": "pyenzymedepfix.enzymeml.core.unitdef",
+    "Vessel": "pyenzymedepfix.enzymeml.core.vessel",
+    "EnzymeReaction": "pyenzymedepfix.enzymeml.core.enzymereaction",
+    "EnzymeMLBase": "pyenzymedepfix.enzymeml.core.enzymemlbase",
+    "MeasurementData": "pyenzymedepfix.enzymeml.core.measurementData",
+    "Measurement": "pyenzymedepfix.enzymeml.core.measurement",
+    "SBOTerm": "pyenzymedepfix.enzymeml.core.ontology",
+    "DataTypes": "pyenzymedepfix.enzymeml.core.ontology",
+}
+
+
+def __getattr__(name):
+    """Imports exported objects on first access to keep the package import light"""
+
+    if name not in _LAZY_OBJECTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_OBJECTS[name]), name)
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_OBJECTS))
@@ -52,6 +52,9 @@ else:
 # Initialize the logger
 logger = logging.getLogger("pyenzyme")
 
+# Use the LibYAML based loader if PyYAML has been built with it
+YAMLSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @static_check_init_args
 class EnzymeMLDocument(EnzymeMLBase):
@@ -158,6 +161,7 @@ class EnzymeMLDocument(EnzymeMLBase):
 
     # * Private attributes
     _unit_dict: Dict[str, UnitDef] = PrivateAttr(default_factory=dict)
+    _unit_string_cache: Optional[tuple] = PrivateAttr(default=None)
 
     # ! Validators
     @validator("log")
@@ -579,18 +583,26 @@ class EnzymeMLDocument(EnzymeMLBase):
                 data = measurement.exportData(species_ids=species_ids)
 
                 # Initialize the data dict that will be returned
-                df = {}
+                columns = {}
                 init_conc = {}
 
-                if reactants:
-                    df.update(data["reactants"]["data"].to_dict())
-                    init_conc.update(data["reactants"]["initConc"])
-                if proteins:
-                    df.update(data["proteins"]["data"].to_dict())
-                    init_conc.update(data["proteins"]["initConc"])
+                for species_type, included in (
+                    ("reactants", reactants),
+                    ("proteins", proteins),
+                ):
+                    if not included:
+                        continue
+
+                    # Collect the columns as Series, the shared time column is
+                    # taken from the last species type as before
+                    frame = data[species_type]["data"]
+                    for column in frame.columns:
+                        columns[column] = frame[column]
+
+                    init_conc.update(data[species_type]["initConc"])
 
                 replicate_data[measurement_id] = {
-                    "data": pd.DataFrame(df),
+                    "data": pd.DataFrame(columns),
                     "initConc": init_conc,
                 }
 
@@ -669,7 +681,10 @@ class EnzymeMLDocument(EnzymeMLBase):
             Bool: Whether or not the document is valid to the given YAML
         """
 
-        validator = EnzymeMLValidator(scheme=yaml.safe_load(open(yaml_path)))
+        with open(yaml_path, "r") as file_handle:
+            scheme = yaml.load(file_handle, Loader=YAMLSafeLoader)
+
+        validator = EnzymeMLValidator(scheme=scheme)
 
         return validator.validate(self)
 
@@ -872,7 +887,7 @@ class EnzymeMLDocument(EnzymeMLBase):
 
         # Load the YAML file
         with open(path, "r") as file_handle:
-            initial_values = yaml.safe_load(file_handle)
+            initial_values = yaml.load(file_handle, Loader=YAMLSafeLoader)
 
         # Apply all given initial values to the model
         for reaction_id, value_dict in initial_values.items():
@@ -1500,10 +1515,23 @@ class EnzymeMLDocument(EnzymeMLBase):
 
         if unit is None:
             raise TypeError("No unit given.")
-        elif unit in self._unit_dict.keys():
+        elif unit in self._unit_dict:
             return unit
 
-        return UnitCreator().getUnit(unit, self)
+        # Parsed unit strings are remembered for as long as the unit dict is not replaced
+        cache = self._unit_string_cache
+
+        if cache is None or cache[0] is not self._unit_dict:
+            cache = (self._unit_dict, {})
+            self._unit_string_cache = cache
+
+        try:
+            return cache[1][unit]
+        except KeyError:
+            unit_id = UnitCreator().getUnit(unit, self)
+            cache[1][unit] = unit_id
+
+            return unit_id
 
     # ! Getter methods
     def getSpeciesIDs(self) -> List[str]:
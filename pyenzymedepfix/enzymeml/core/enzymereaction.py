@@ -253,7 +253,6 @@ class EnzymeReaction(EnzymeMLBase):
             id=id, element_list=self.modifiers, element_type="Modifiers"
         )
 
-    @validate_arguments
     def _getReactionElement(
         self,
         id: str,
@@ -261,6 +260,7 @@ class EnzymeReaction(EnzymeMLBase):
         element_type: str,
     ) -> ReactionElement:
 
+        # Element lists are already validated, re-validating them would copy every element
         try:
             return next(filter(lambda element: element.species_id == id, element_list))
         except StopIteration:
@@ -509,13 +509,23 @@ class EnzymeReaction(EnzymeMLBase):
         if by_name is False:
             return equation
 
+        # Map all document IDs once, most symbols are parameters and not found
+        names = {
+            id: obj.name
+            for dictionary in (
+                enzmldoc._unit_dict,
+                enzmldoc.vessel_dict,
+                enzmldoc.reactant_dict,
+                enzmldoc.protein_dict,
+                enzmldoc.complex_dict,
+                enzmldoc.reaction_dict,
+            )
+            for id, obj in dictionary.items()
+        }
+
         for node in ast.walk(ast.parse(equation)):
-            if isinstance(node, ast.Name):
-                try:
-                    name = enzmldoc.getAny(node.id).name
-                    equation = equation.replace(node.id, name)
-                except SpeciesNotFoundError:
-                    pass
+            if isinstance(node, ast.Name) and node.id in names:
+                equation = equation.replace(node.id, names[node.id])
 
         return equation
 
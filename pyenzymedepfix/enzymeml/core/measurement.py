@@ -4,8 +4,8 @@
 # License: BSD-2 clause
 # Copyright (c) 2022 Institute of Biochemistry and Technical Biochemistry Stuttgart
 
-import copy
 import logging
+import numpy as np
 import pandas as pd
 
 from typing import List, Dict, Tuple, Optional, TYPE_CHECKING, Union
@@ -155,64 +155,88 @@ class Measurement(EnzymeMLBase):
             species_ids (Union[str, List[str]]): List of species IDs to extract data from. Defaults to 'all'.
         """
 
-        # Combine Replicate objects for each reaction
-        proteins = self._combineReplicates(
-            measurement_species=self.species_dict["proteins"], species_ids=species_ids
-        )
-        reactants = self._combineReplicates(
-            measurement_species=self.species_dict["reactants"], species_ids=species_ids
-        )
+        if isinstance(species_ids, str):
+            species_ids = [species_ids]
 
-        return {"proteins": proteins, "reactants": reactants}
+        wants_all = species_ids == ["all"]
+        wanted_ids = None if wants_all else frozenset(species_ids)
+
+        # Proteins and reactants share the time course, convert it only once
+        global_time = self._getGlobalTimeArray()
+
+        # Select the requested species of all types in a single pass and combine their replicates
+        return {
+            species_type: self._combineReplicates(
+                measurement_species={
+                    species_id: data
+                    for species_id, data in measurement_species.items()
+                    if wants_all or species_id in wanted_ids
+                },
+                global_time=global_time,
+            )
+            for species_type, measurement_species in self.species_dict.items()
+        }
 
     def _combineReplicates(
         self,
         measurement_species: Dict[str, MeasurementData],
-        species_ids: Union[str, List[str]] = "all",
+        global_time: Optional[np.ndarray] = None,
     ) -> Dict[str, Union[Dict[str, Tuple[float, str]], pd.DataFrame]]:
-        """Combines replicates of a certain species to a dataframe.
+        """Combines replicates of the given species to a dataframe.
 
         Args:
-            measurement_species (Dict[str, MeasurementData]): The species_dict from the measurement.
+            measurement_species (Dict[str, MeasurementData]): The selected species of one type from the measurement.
+            global_time (Optional[np.ndarray]): Global time as float array. Converted from the measurement if not given.
 
         Returns:
             Dict[str, Any]: The associated replicat and initconc data.
         """
 
-        if isinstance(species_ids, str):
-            species_ids = [species_ids]
-
-        columns = {}
         initial_concentration = {}
+        species_data = {}
         num_replicates = 0
 
-        # Iterate over measurementData to fill columns
+        # Iterate over measurementData to collect the columns
         for species_id, data in measurement_species.items():
 
-            if species_id in species_ids or species_ids == ["all"]:
+            # Fetch initial concentration
+            initial_concentration[species_id] = (data.init_conc, data.unit)
 
-                # Fetch initial concentration
-                initial_concentration[species_id] = (data.init_conc, data.unit)
+            # Fetch replicate data
+            if len(data.replicates) > num_replicates:
+                num_replicates = len(data.replicates)
+            if data.replicates:
+                species_data[species_id] = data
 
-                # Fetch replicate data
-                if len(data.replicates) > num_replicates:
-                    num_replicates = len(data.replicates)
-                for replicate in data.replicates:
+        if not species_data:
+            return {"data": pd.DataFrame(), "initConc": initial_concentration}
 
-                    if columns.get(species_id):
-                        # For multiple replicates
-                        columns[species_id] += copy.deepcopy(replicate.data)
-                    else:
-                        columns[species_id] = copy.deepcopy(replicate.data)
+        # Preallocate the data, multiple replicates are stacked along the rows
+        columns = [*species_data.keys(), "time"]
+        values = np.empty(
+            (len(self.global_time) * num_replicates, len(columns)), dtype=np.float64
+        )
 
-        # Add global time to columns according to the number of replicates
-        columns["time"] = self.global_time * num_replicates
+        for index, data in enumerate(species_data.values()):
+            # Column-major ravel stacks the replicate columns on top of each other
+            values[:, index] = data._stackReplicates().ravel(order="F")
+
+        if global_time is None:
+            global_time = self._getGlobalTimeArray()
+
+        # Add global time according to the number of replicates
+        values[:, -1] = np.tile(global_time, num_replicates)
 
         return {
-            "data": pd.DataFrame(columns) if len(columns) > 1 else pd.DataFrame(),
+            "data": pd.DataFrame(values, columns=columns, copy=False),
             "initConc": initial_concentration,
         }
 
+    def _getGlobalTimeArray(self) -> np.ndarray:
+        """Returns the global time as a float array, converted on every call to reflect in-place edits"""
+
+        return np.asarray(self.global_time, dtype=np.float64)
+
     @validate_arguments
     def addReplicates(
         self, replicates: Union[List[Replicate], Replicate], enzmldoc, log: bool = True
@@ -398,7 +422,6 @@ class Measurement(EnzymeMLBase):
 
         return self._enzmldoc._unit_dict[self._temperature_unit_id]
 
-    @validate_arguments
     def getReactant(self, reactant_id: str) -> MeasurementData:
         """Returns a single MeasurementData object for the given reactant_id.
 
@@ -440,19 +463,15 @@ class Measurement(EnzymeMLBase):
     def _getAllSpecies(self):
         return {**self.species_dict["proteins"], **self.species_dict["reactants"]}
 
-    @validate_arguments
     def _getSpecies(self, species_id: str) -> MeasurementData:
-        all_species = {
-            **self.species_dict["proteins"],
-            **self.species_dict["reactants"],
-        }
+        # Look up both dicts directly instead of merging them, reactants take precedence
+        for key in ("reactants", "proteins"):
+            species = self.species_dict[key]
 
-        try:
-            return all_species[species_id]
-        except KeyError:
-            raise SpeciesNotFoundError(
-                species_id=species_id, enzymeml_part="Measurement"
-            )
+            if species_id in species:
+                return species[species_id]
+
+        raise SpeciesNotFoundError(species_id=species_id, enzymeml_part="Measurement")
 
     @deprecated_getter("id")
     def getId(self):
@@ -4,9 +4,11 @@
 # License: BSD-2 clause
 # Copyright (c) 2022 Institute of Biochemistry and Technical Biochemistry Stuttgart
 
+import numpy as np
+
 from pydantic import PositiveFloat, validate_arguments, validator, Field, PrivateAttr
 from dataclasses import dataclass
-from typing import List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 from pyenzymedepfix.enzymeml.core.enzymemlbase import EnzymeMLBase
 
 from pyenzymedepfix.enzymeml.core.replicate import Replicate
@@ -95,10 +97,15 @@ class MeasurementData(EnzymeMLBase):
         self._unit_id = unit_id
         self.unit = new_unit_name
 
-        # Apply to replicates
+        # Apply to replicates, replicates sharing a unit share the transformation
+        transformations = {}
         for replicate in self.replicates:
             self._rescaleReplicateUnits(
-                replicate=replicate, kind=kind, scale=scale, enzmldoc=enzmldoc
+                replicate=replicate,
+                kind=kind,
+                scale=scale,
+                enzmldoc=enzmldoc,
+                transformations=transformations,
             )
 
     @staticmethod
@@ -122,7 +129,12 @@ class MeasurementData(EnzymeMLBase):
         return transform_value, new_unit_name, unit_id
 
     def _rescaleReplicateUnits(
-        self, replicate: Replicate, kind: str, scale: int, enzmldoc
+        self,
+        replicate: Replicate,
+        kind: str,
+        scale: int,
+        enzmldoc,
+        transformations: Optional[Dict[str, Tuple[float, str, str]]] = None,
     ) -> None:
         """Rescales a replicates data_unit to match the desired scale.
 
@@ -131,21 +143,42 @@ class MeasurementData(EnzymeMLBase):
             kind (str): The kind of unit that will be rescaled.
             scale (int): The scale to whih the data will be transformed.
             enzmldoc ([type]): The EnzymeML document to which the new unit will be added.
+            transformations (Dict[str, Tuple[float, str, str]], optional): Cache of already calculated transformations by unit ID. Defaults to None.
         """
 
+        if transformations is None:
+            transformations = {}
+
         data_unit_id = replicate._data_unit_id
-        unitdef: UnitDef = enzmldoc._unit_dict[data_unit_id].copy()
 
-        # Calculate the scale to transform the unit
-        transform_value, new_unit_name, unit_id = self._getTransformation(
-            unitdef, kind, scale, enzmldoc
-        )
+        if data_unit_id not in transformations:
+            # Calculate the scale to transform the unit
+            unitdef: UnitDef = enzmldoc._unit_dict[data_unit_id].copy()
+            transformations[data_unit_id] = self._getTransformation(
+                unitdef, kind, scale, enzmldoc
+            )
+
+        transform_value, new_unit_name, unit_id = transformations[data_unit_id]
 
         # Re-scale and assign the new data of the replicate
-        replicate.data = [data_point * transform_value for data_point in replicate.data]
+        if transform_value != 1:
+            replicate.data = (
+                np.asarray(replicate.data, dtype=np.float64) * transform_value
+            ).tolist()
         replicate._data_unit_id = unit_id
         replicate.data_unit = new_unit_name
 
+    def _stackReplicates(self) -> np.ndarray:
+        """Returns the data of all replicates as columns of a single matrix.
+
+        Returns:
+            np.ndarray: Array of shape (time steps, replicates).
+        """
+
+        return np.array(
+            [replicate.data for replicate in self.replicates], dtype=np.float64
+        ).T
+
     @validate_arguments
     def addReplicate(self, replicate: Replicate) -> None:
         self.replicates.append(replicate)
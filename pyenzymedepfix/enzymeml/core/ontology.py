@@ -55,6 +55,10 @@ class SBOTerm(str, Enum):
     V_MAX = "SBO:0000186"
 
 
+# Plain mapping for hot paths, which avoids the Enum call machinery
+SBO_NAMES = {term.value: term.name for term in SBOTerm}
+
+
 class DataTypes(str, Enum):
     """String enumeration used to assign replicate type ontologies"""
 
@@ -80,10 +84,18 @@ class EnzymeMLPart(str, Enum):
 
     @classmethod
     def partFromSBOTerm(cls, sbo_term: str) -> str:
-        sbo_term = SBOTerm(sbo_term).name
-        return getattr(cls, sbo_term).value
+        return getattr(cls, cls._termName(sbo_term)).value
 
     @classmethod
     def entityFromSBOTerm(cls, sbo_term: str) -> str:
-        sbo_term = SBOTerm(sbo_term).name
-        return getattr(cls, sbo_term).name
+        return getattr(cls, cls._termName(sbo_term)).name
+
+    @staticmethod
+    def _termName(sbo_term: str) -> str:
+        if isinstance(sbo_term, SBOTerm):
+            return sbo_term.name
+
+        try:
+            return SBO_NAMES[sbo_term]
+        except (KeyError, TypeError):
+            raise ValueError(f"'{sbo_term}' is not a valid SBOTerm")
@@ -17,6 +17,9 @@ if TYPE_CHECKING:  # pragma: no cover
 else:
     static_check_init_args = type_checking
 
+# Powers of ten for the decade scales of SI prefixes
+_POW10 = {exponent: 10.0**exponent for exponent in range(-24, 25)}
+
 
 @static_check_init_args
 class BaseUnit(EnzymeMLBase):
@@ -213,17 +216,32 @@ class UnitDef(EnzymeMLBase):
             float: The value that is needed to re-scale the given unit to the desired scale.
         """
 
-        for base_unit in self.units:
-            if base_unit.kind == kind:
+        base_unit = self._getBaseUnit(kind)
+
+        if base_unit is None:
+            raise ValueError(f"Unit kind of {kind} is not part of the unit definition")
+
+        # correction factor used for the case of scale=1
+        correction_factor = -1 if base_unit.scale == 1 else 0
+
+        exponent = base_unit.exponent * (base_unit.scale - scale + correction_factor)
 
-                # correction factor used for the case of scale=1
-                correction_factor = -1 if base_unit.scale == 1 else 0
+        try:
+            return _POW10[exponent]
+        except KeyError:
+            return 10**exponent
 
-                return 10 ** (
-                    base_unit.exponent * (base_unit.scale - scale + correction_factor)
-                )
+    def _getBaseUnit(self, kind: str) -> Optional[BaseUnit]:
+        """Returns the first base unit of the given kind or None if there is none.
 
-        raise ValueError(f"Unit kind of {kind} is not part of the unit definition")
+        A unit definition holds only a few base units, so the list is scanned on every call.
+        """
+
+        for base_unit in self.units:
+            if base_unit.kind == kind:
+                return base_unit
+
+        return None
 
     def _getNewName(self) -> str:
         """Internal function used to derive a units new name. Will be assigned using enzmldoc._convertTounitDef.
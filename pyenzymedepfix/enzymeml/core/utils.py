@@ -4,6 +4,9 @@
 # License: BSD-2 clause
 # Copyright (c) 2022 Institute of Biochemistry and Technical Biochemistry Stuttgart
 
+import copy
+import shutil
+import tempfile
 
 from deprecation import deprecated
 
@@ -25,3 +28,27 @@ def deprecated_method(name: str):
     return deprecated(
         details=f"Use the method `{name}` instead.",
     )
+
+
+def deepcopy_enzmldoc(enzmldoc):
+    """Returns an independent deep copy of an EnzymeMLDocument.
+
+    File handles of attached files cannot be deep-copied, their content is copied
+    to new temporary files at the same read position instead.
+    """
+
+    memo = {}
+    for file_entry in enzmldoc.file_dict.values():
+        handler = file_entry["handler"]
+        position = handler.tell()
+
+        file_copy = tempfile.NamedTemporaryFile()
+        handler.seek(0)
+        shutil.copyfileobj(handler, file_copy)
+        handler.seek(position)
+        file_copy.seek(position)
+        file_copy.name = handler.name
+
+        memo[id(handler)] = file_copy
+
+    return copy.deepcopy(enzmldoc, memo)
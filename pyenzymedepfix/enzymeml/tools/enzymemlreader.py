@@ -686,14 +686,16 @@ class EnzymeMLReader:
             data_annotation, enzmldoc=enzmldoc
         )
 
-        # Iterate over measurements and assign replicates
-        for measurement_id, measurement_file in measurement_files.items():
+        # Measurements without data have no files or formats to parse
+        if not measurement_files:
+            return measurement_dict
 
-            # Fetch list of files
-            files = self._parseListOfFiles(data_annotation)
+        # Fetch list of files and formats, these are shared by all measurements
+        files = self._parseListOfFiles(data_annotation)
+        formats = self._parseListOfFormats(data_annotation)
 
-            # Fetch formats
-            formats = self._parseListOfFormats(data_annotation)
+        # Iterate over measurements and assign replicates
+        for measurement_id, measurement_file in measurement_files.items():
 
             # Get file content
             fileInfo = files[measurement_file]
@@ -98,8 +98,9 @@ class UnitCreator:
             self.__functionDict[baseunit](unitdef, prefix, exponent)
 
         # Check if there is already a similar unit defined
-        if self.__checkFootprints(enzmldoc, unitdef.getFootprint()) != "NEW":
-            return self.__checkFootprints(enzmldoc, unitdef.getFootprint())
+        existing_id = self.__checkFootprints(enzmldoc, unitdef.getFootprint())
+        if existing_id != "NEW":
+            return existing_id
 
         enzmldoc._unit_dict[unitdef.id] = unitdef
 
@@ -33,6 +33,11 @@ ch.setFormatter(formatter)
 # add ch to logger
 logger.addHandler(ch)
 
+# Extracts module and class name from the repr of a type annotation
+ANNOTATION_PATTERN = re.compile(
+    r"(pyenzymedepfix.enzymeml.[a-zA-Z]*.[a-zA-Z]*).([a-zA-Z]*)"
+)
+
 
 class EnzymeMLValidator:
     def __init__(self, scheme: Dict):
@@ -246,9 +251,7 @@ class EnzymeMLValidator:
             if "pyenzymedepfix.enzymeml" in repr(value) and "ontology" not in repr(value):
 
                 annot = repr(value)
-                regex = r"(pyenzymedepfix.enzymeml.[a-zA-Z]*.[a-zA-Z]*).([a-zA-Z]*)"
-                regex = re.compile(regex)
-                module, cls_name = regex.findall(annot)[0]
+                module, cls_name = ANNOTATION_PATTERN.findall(annot)[0]
 
                 sub_class = getattr(importlib.import_module(module), cls_name)
 
@@ -4,10 +4,58 @@
 # License: BSD-2 clause
 # Copyright (c) 2022 Institute of Biochemistry and Technical Biochemistry Stuttgart
 
+import os
+import threading
+
 from abc import ABC, abstractmethod
-from typing import Union, Optional
+from collections import OrderedDict
+from typing import Tuple, Union, Optional
 
 from pyenzymedepfix.enzymeml.core.enzymemldocument import EnzymeMLDocument
+from pyenzymedepfix.enzymeml.core.utils import deepcopy_enzmldoc
+
+# Parsed documents by path and modification time of their OMEX container
+_DOCUMENT_CACHE_SIZE = 32
+_document_cache: "OrderedDict[Tuple[str, float], EnzymeMLDocument]" = OrderedDict()
+_document_cache_lock = threading.Lock()
+
+
+def load_enzmldoc(path: str) -> EnzymeMLDocument:
+    """Returns an EnzymeMLDocument from an OMEX container, re-using previously parsed documents.
+
+    Since thin layers modify the document (e.g. when applying an initialization file),
+    every call receives its own deep copy of the cached document. Documents with attached
+    files are not cached, so that their open file handles are not kept alive.
+
+    Args:
+        path (str): Path to the OMEX container.
+
+    Returns:
+        EnzymeMLDocument: A private copy of the parsed document.
+    """
+
+    path = os.path.normpath(os.path.abspath(path))
+    key = (path, os.stat(path).st_mtime)
+
+    with _document_cache_lock:
+        cached = _document_cache.get(key)
+        if cached is not None:
+            _document_cache.move_to_end(key)
+
+    if cached is not None:
+        return deepcopy_enzmldoc(cached)
+
+    enzmldoc = EnzymeMLDocument.fromFile(path)
+
+    if enzmldoc.file_dict:
+        return enzmldoc
+
+    with _document_cache_lock:
+        _document_cache[key] = deepcopy_enzmldoc(enzmldoc)
+        if len(_document_cache) > _DOCUMENT_CACHE_SIZE:
+            _document_cache.popitem(last=False)
+
+    return enzmldoc
 
 
 class BaseThinLayer(ABC):
@@ -21,9 +69,13 @@ class BaseThinLayer(ABC):
         if isinstance(measurement_ids, str) and measurement_ids != "all":
             raise TypeError("Measurements must either be a list of IDs or 'all'")
 
-        # Load the EnzymeML document to gather data
-        self.filepath = path
-        self.enzmldoc = EnzymeMLDocument.fromFile(path)
+        # Load the EnzymeML document to gather data, parsed documents can be passed directly
+        if isinstance(path, EnzymeMLDocument):
+            self.filepath = None
+            self.enzmldoc = deepcopy_enzmldoc(path)
+        else:
+            self.filepath = path
+            self.enzmldoc = load_enzmldoc(path)
 
         # If an initialization schema is given, apply it here
         if init_file:
@@ -47,18 +47,32 @@ from typing import Union, Optional
 
 from pyenzymedepfix.thinlayers import BaseThinLayer
 import os
+import numpy as np
 import pandas as pd
-from builtins import enumerate
 
-_COPASI_IMPORT_ERROR = None
-try:
-    import COPASI
-except ModuleNotFoundError as e:
-    _COPASI_IMPORT_ERROR = """
+# COPASI is imported on first use, loading the bindings takes several seconds
+COPASI = None
+_COPASI_IMPORT_ERROR = """
     ThinLayerCopasi is not available. 
     To use it, please install the following dependencies:
     {}
-    """.format(e)
+    """
+
+
+def _import_copasi():
+    """Imports the COPASI bindings once and raises a RuntimeError if they are missing"""
+    global COPASI
+
+    if COPASI is None:
+        try:
+            import COPASI as copasi
+        except ModuleNotFoundError as e:
+            raise RuntimeError(_COPASI_IMPORT_ERROR.format(e))
+
+        COPASI = copasi
+
+    return COPASI
+
 
 log = logging.getLogger(__name__)
 
@@ -72,15 +86,14 @@ class ThinLayerCopasi(BaseThinLayer):
         Initializes a new instance of the COPASI thin layer, by loading the EnzymeML file
         specified in `path` and creating a COPASI file (+ data) in `outdir`.
 
-        :param path: the enzyme ml document to load
+        :param path: the enzyme ml document to load, either as path or as EnzymeMLDocument
         :param outdir: the output dir
         :param measurement_ids: the measurement ids or all
         :param init_file: optional initialization file for fit items
 
         """
         # check dependencies
-        if _COPASI_IMPORT_ERROR:
-            raise RuntimeError(_COPASI_IMPORT_ERROR)
+        _import_copasi()
 
         # initialize base class, let it do the reading
         BaseThinLayer.__init__(
@@ -125,13 +138,14 @@ class ThinLayerCopasi(BaseThinLayer):
     def _init_maps(self):
         """Initializes a map from SBML id to COPASI objects"""
         self.sbml_id_map = {}
-        for item in self.dm.getModel().getMetabolites():
+        model = self.dm.getModel()
+        for item in model.getMetabolites():
             self.sbml_id_map[item.getSBMLId()] = item
-        for item in self.dm.getModel().getModelValues():
+        for item in model.getModelValues():
             self.sbml_id_map[item.getSBMLId()] = item
-        for item in self.dm.getModel().getReactions():
+        for item in model.getReactions():
             self.sbml_id_map[item.getSBMLId()] = item
-        for item in self.dm.getModel().getCompartments():
+        for item in model.getCompartments():
             self.sbml_id_map[item.getSBMLId()] = item
 
     def _get_cn_for_item(self, item):
@@ -160,19 +174,30 @@ class ThinLayerCopasi(BaseThinLayer):
 
         return None
 
+    @staticmethod
+    def _write_tsv(filename, data):
+        """ Writes the experiment data to a TSV file, missing values are left empty
+
+        :param filename: path of the TSV file
+        :param data: pandas dataframe with one column per sbml id
+        :return: None
+        """
+        data.to_csv(filename, sep='\t', float_format='%.10g', index=False, lineterminator='\n')
+
     def _import_experiments(self):
         """ Writes all experiments to TSV file and performs mapping in COPASI
 
         :return: None
         """
-        for measurement_id, measurement_dict in self.data.items():
-            sbml_ids = measurement_dict['data'].columns.to_list()
+        experiments = []
 
+        for measurement_id, measurement_dict in self.data.items():
             data = measurement_dict['data']
 
+            # initial concentrations are only given in the first row of the experiment
+            init_columns = {}
             for k, v in measurement_dict['initConc'].items():
-                data = data.join(pd.DataFrame({'init_{0}'.format(k): [v[0]]}))
-                sbml_ids.append('init_{0}'.format(k))
+                init_columns['init_{0}'.format(k)] = [v[0]]
                 # validate value
                 if k in data.columns:
                     initial_value = data[data['time'] == 0.0][k]
@@ -181,11 +206,22 @@ class ThinLayerCopasi(BaseThinLayer):
                                     f'is inconsistent with the specified initial concentration: '
                                     f'{float(initial_value)} != {v[0]}')
 
+            # join all initial concentrations at once instead of copying the data per species
+            data = data.join(pd.DataFrame(init_columns))
+
             exp_filename = os.path.abspath(os.path.join(
                 self.working_dir, measurement_id + '.tsv'))
 
-            data.to_csv(exp_filename,
-                        sep='\t', header=True, index=False)
+            self._write_tsv(exp_filename, data)
+            experiments.append((measurement_id, exp_filename, data))
+
+        # the CNs of a species are the same in every experiment, resolve them only once
+        dependent_cns = {}
+        independent_cns = {}
+
+        # register the written experiments in COPASI
+        for measurement_id, exp_filename, data in experiments:
+            sbml_ids = data.columns.to_list()
 
             exp = COPASI.CExperiment(self.dm)
             exp.setObjectName(
@@ -199,8 +235,6 @@ class ThinLayerCopasi(BaseThinLayer):
             exp.setSeparator('\t')
             exp.setNumColumns(len(sbml_ids))
             exp = self.exp_set.addExperiment(exp)
-            info = COPASI.CExperimentFileInfo(self.exp_set)
-            info.setFileName(exp_filename)
 
             # Mapping from .tsv file to COPASI bindings
             obj_map = exp.getObjectMap()
@@ -211,17 +245,21 @@ class ThinLayerCopasi(BaseThinLayer):
                     role = COPASI.CExperiment.time
                     obj_map.setRole(i, role)
 
-                elif col in self.sbml_id_map.keys():
+                elif col in self.sbml_id_map:
                     role = COPASI.CExperiment.dependent
                     obj_map.setRole(i, role)
-                    obj_map.setObjectCN(i, self.sbml_id_map[col]
-                                        .getConcentrationReference().getCN().getString())
+                    if col not in dependent_cns:
+                        dependent_cns[col] = self.sbml_id_map[col] \
+                            .getConcentrationReference().getCN().getString()
+                    obj_map.setObjectCN(i, dependent_cns[col])
 
-                elif col.startswith('init_') and col[5:] in self.sbml_id_map.keys():
+                elif col.startswith('init_') and col[5:] in self.sbml_id_map:
                     role = COPASI.CExperiment.independent
                     obj_map.setRole(i, role)
-                    obj_map.setObjectCN(i, self.sbml_id_map[col[5:]]
-                                        .getInitialConcentrationReference().getCN().getString())
+                    if col not in independent_cns:
+                        independent_cns[col] = self.sbml_id_map[col[5:]] \
+                            .getInitialConcentrationReference().getCN().getString()
+                    obj_map.setObjectCN(i, independent_cns[col])
 
                 else:
                     role = COPASI.CExperiment.ignore
@@ -297,7 +335,7 @@ class ThinLayerCopasi(BaseThinLayer):
         new_values = [val for val in self.problem.getSolutionVariables()]
         sd_values = [val for val in self.problem.getVariableStdDeviations()]
         if len(fit_items) != len(new_values):
-            logging.error('No results available yet, run `optimize` first.')
+            log.error('No results available yet, run `optimize` first.')
             return None
 
         for i, vals in enumerate(fit_items):
@@ -369,17 +407,20 @@ class ThinLayerCopasi(BaseThinLayer):
 
         :return: None
         """
-        for reaction_id, data in self.reaction_data.items():
+        value_reference = COPASI.CCommonName('Reference=Value')
+        lower_bound = COPASI.CCommonName(str(1e-6))
+        upper_bound = COPASI.CCommonName(str(1e6))
+
+        for reaction_id, (model, _) in self.reaction_data.items():
             r = self.sbml_id_map[reaction_id]
             assert (isinstance(r, COPASI.CReaction))
-            for p in self.reaction_data[reaction_id][0].parameters:
-                obj = r.getParameterObjects(p.name)[0].getObject(
-                    COPASI.CCommonName('Reference=Value'))
+            for p in model.parameters:
+                obj = r.getParameterObjects(p.name)[0].getObject(value_reference)
                 cn = obj.getCN()
                 fit_item = self.problem.addFitItem(cn)
                 assert (isinstance(fit_item, COPASI.CFitItem))
-                fit_item.setLowerBound(COPASI.CCommonName(str(1e-6)))
-                fit_item.setUpperBound(COPASI.CCommonName(str(1e6)))
+                fit_item.setLowerBound(lower_bound)
+                fit_item.setUpperBound(upper_bound)
                 fit_item.setStartValue(float(p.value))
 
     def _set_default_items_from_init_file(self):
@@ -400,7 +441,7 @@ class ThinLayerCopasi(BaseThinLayer):
                 # nan values used to indicate that this should not be fitted
                 continue
 
-            mv = self.dm.getModel().getModelValue(global_param.name)
+            mv = self.model.getModelValue(global_param.name)
             if not mv:
                 log.warning(
                     "No global parameter {0} in the model".format(global_param.name))
@@ -420,6 +461,8 @@ class ThinLayerCopasi(BaseThinLayer):
             fit_item.setUpperBound(COPASI.CCommonName(str(global_param.upper)))
             fit_item.setStartValue(float(value))
 
+        value_reference = COPASI.CCommonName('Reference=Value')
+
         for reaction_id, (model, _) in self.reaction_data.items():
             r = self.sbml_id_map[reaction_id]
             assert (isinstance(r, COPASI.CReaction))
@@ -438,8 +481,7 @@ class ThinLayerCopasi(BaseThinLayer):
                         f"Neither initial_value nor value given for parameter {p.name} in reaction {reaction_id}"
                     )
 
-                obj = r.getParameterObjects(p.name)[0].getObject(
-                    COPASI.CCommonName('Reference=Value'))
+                obj = r.getParameterObjects(p.name)[0].getObject(value_reference)
                 cn = obj.getCN()
                 fit_item = self.problem.addFitItem(cn)
                 assert (isinstance(fit_item, COPASI.CFitItem))
@@ -221,7 +221,8 @@ class ThinLayerPysces(BaseThinLayer):
         # First, convert the EnzymeML model to a PySCeS model
         pscfile_path = sbmlfile_path + ".psc"
         if not (
-            (os.path.exists(pscfile_path))
+            (self.filepath is not None)
+            and (os.path.exists(pscfile_path))
             and (os.path.getmtime(pscfile_path) > os.path.getmtime(self.filepath))
         ):
             pysces.interface.convertSBML2PSC(sbmlfile_name, sbmldir=model_dir, pscdir=model_dir)
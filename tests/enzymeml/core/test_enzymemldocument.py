@@ -169,6 +169,21 @@ class TestEnzymeMLDocument:
 
         assert unit == "umole / l"
 
+    def test_unit_string_cache(self):
+        """Tests whether repeated unit strings resolve to the same unit definition"""
+
+        enzmldoc = EnzymeMLDocument(name="Test")
+
+        unit_id = enzmldoc._convertToUnitDef("mmole / l")
+
+        assert enzmldoc._convertToUnitDef("mmole / l") == unit_id
+        assert len(enzmldoc._unit_dict) == 1
+
+        # A replaced unit dict must not be served from the cache
+        enzmldoc._unit_dict = {}
+
+        assert enzmldoc._convertToUnitDef("mmole / l") in enzmldoc._unit_dict
+
     def test_full_data_export(self, enzmldoc):
         """Tests whether data is exported correctly"""
 
@@ -1,6 +1,7 @@
 import pytest
 
 from pyenzymedepfix.enzymeml.core.measurement import Measurement
+from pyenzymedepfix.enzymeml.core.exceptions import SpeciesNotFoundError
 
 
 class TestMeasurement:
@@ -77,6 +78,16 @@ class TestMeasurement:
         assert data["reactants"]["data"].to_dict() == expected_reactant
         assert data["proteins"]["data"].to_dict() == expected_protein
 
+    def test_data_export_time_change(self, measurement):
+        """Tests whether in-place changes of the global time are exported"""
+
+        measurement.exportData()
+        measurement.global_time[0] = 123.0
+
+        data = measurement.exportData()
+
+        assert data["reactants"]["data"]["time"].tolist() == [123.0, 2.0, 3.0, 4.0]
+
     def test_data_export_no_repls(self, measurement):
         """Tests export method when no replicates are given"""
 
@@ -186,6 +197,28 @@ class TestMeasurement:
         assert reactant.unit == "mmole / l"
         assert reactant.replicates == [replicate]
 
+    def test_get_species(self, measurement):
+        """Tests the retrieval of measurement data after modifications"""
+
+        assert measurement.getReactant("s0").reactant_id == "s0"
+        assert measurement.getProtein("p0").protein_id == "p0"
+
+        # Replacing existing data should be reflected
+        measurement.addData(init_conc=20.0, unit="mmole / l", reactant_id="s0")
+        assert measurement.getReactant("s0").init_conc == 20.0
+
+        # Newly added species should be found
+        measurement.addData(init_conc=5.0, unit="mmole / l", reactant_id="s1")
+        assert measurement.getReactant("s1").init_conc == 5.0
+
+        # Entries replaced in the public species dict should be reflected
+        replaced = measurement.getReactant("s0").copy(update={"init_conc": 999.0})
+        measurement.species_dict["reactants"]["s0"] = replaced
+        assert measurement.getReactant("s0") is replaced
+
+        with pytest.raises(SpeciesNotFoundError):
+            measurement.getReactant("s100")
+
     def test_unit_unification(self, enzmldoc):
         """Tests if unit unification works"""
 
@@ -78,3 +78,19 @@ class TestMeasurementData:
         data.addReplicate(replicate)
 
         assert data.replicates == [replicate]
+
+    def test_stack_replicates(self, measurement, replicate):
+        """Tests the columnar representation of the replicates"""
+
+        data = measurement.species_dict["reactants"]["s0"]
+
+        replicate2 = replicate.copy()
+        replicate2.id = "repl_s0_1"
+        replicate2.data = [2.0, 2.0, 2.0, 2.0]
+        data.replicates = [replicate, replicate2]
+
+        stacked = data._stackReplicates()
+
+        assert stacked.shape == (4, 2)
+        assert stacked[:, 0].tolist() == replicate.data
+        assert stacked[:, 1].tolist() == [2.0, 2.0, 2.0, 2.0]
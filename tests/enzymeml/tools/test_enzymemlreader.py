@@ -0,0 +1,16 @@
+from pyenzymedepfix.enzymeml.core.enzymemldocument import EnzymeMLDocument
+
+
+class TestEnzymeMLReader:
+    def test_measurements_without_files(self):
+        """Tests reading a document whose measurements carry no data files"""
+
+        # The STRENDA example has measurements but no enzymeml:files annotation
+        enzmldoc = EnzymeMLDocument.fromFile(
+            "./examples/ThinLayers/STRENDA/Generated/3IZNOK_TEST.omex"
+        )
+
+        assert len(enzmldoc.measurement_dict) == 9
+
+        for measurement in enzmldoc.measurement_dict.values():
+            assert not measurement.global_time
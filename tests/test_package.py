@@ -0,0 +1,72 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def run_fresh(code: str) -> str:
+    """Runs code in a new interpreter, where no submodule has been imported yet"""
+
+    return subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+
+class TestPackageExports:
+    @pytest.mark.parametrize(
+        "module",
+        [
+            "pyenzymedepfix",
+            "pyenzymedepfix.enzymeml",
+            "pyenzymedepfix.enzymeml.core",
+        ],
+    )
+    def test_star_import(self, module):
+        """Tests whether a star import provides every exported name"""
+
+        namespace = {}
+        exec(f"from {module} import *", namespace)
+
+        exported = __import__(module, fromlist=["__all__"]).__all__
+
+        assert all(name in namespace for name in exported)
+
+    def test_star_import_names(self):
+        """Tests whether the star import of the package provides the public API"""
+
+        output = run_fresh(
+            "from pyenzymedepfix import *; "
+            "print(EnzymeMLDocument.__name__, Vessel.__name__, Protein.__name__, "
+            "Reactant.__name__, KineticModel.__name__, setup_custom_logger.__name__, "
+            "enzymeml.__name__, utils.__name__)"
+        )
+
+        assert output.split() == [
+            "EnzymeMLDocument",
+            "Vessel",
+            "Protein",
+            "Reactant",
+            "KineticModel",
+            "setup_custom_logger",
+            "pyenzymedepfix.enzymeml",
+            "pyenzymedepfix.utils",
+        ]
+
+    def test_submodule_access(self):
+        """Tests whether subpackages are reachable as attributes without importing them"""
+
+        output = run_fresh(
+            "import pyenzymedepfix as pe; "
+            "print(pe.utils.__name__, pe.enzymeml.core.__name__, "
+            "pe.enzymeml.tools.__name__, pe.enzymeml.models.__name__)"
+        )
+
+        assert output.split() == [
+            "pyenzymedepfix.utils",
+            "pyenzymedepfix.enzymeml.core",
+            "pyenzymedepfix.enzymeml.tools",
+            "pyenzymedepfix.enzymeml.models",
+        ]
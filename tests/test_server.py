@@ -0,0 +1,136 @@
+import io
+import pytest
+
+from collections import OrderedDict
+
+pytest.importorskip("fastapi")
+
+from starlette.datastructures import UploadFile
+
+import pyenzyme_server
+
+from pyenzymedepfix.enzymeml.core.enzymemldocument import EnzymeMLDocument
+
+OMEX_FIXTURE = "./tests/fixtures/test_case.omex"
+
+
+def make_upload(path: str = OMEX_FIXTURE) -> UploadFile:
+    with open(path, "rb") as file_handle:
+        return UploadFile(
+            file=io.BytesIO(file_handle.read()), filename="test_case.omex"
+        )
+
+
+@pytest.fixture
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(pyenzyme_server, "document_cache", OrderedDict())
+    monkeypatch.setattr(pyenzyme_server, "document_cache_bytes", 0)
+
+
+@pytest.fixture
+def count_reads(monkeypatch):
+    calls = []
+    from_file = EnzymeMLDocument.fromFile
+
+    def counting_from_file(path):
+        calls.append(path)
+        return from_file(path)
+
+    monkeypatch.setattr(EnzymeMLDocument, "fromFile", counting_from_file)
+
+    return calls
+
+
+class TestDocumentCache:
+    def test_repeated_upload(self, empty_cache, count_reads):
+        """Tests whether a repeated upload is served from the cache as a copy"""
+
+        first = pyenzyme_server.read_upload(make_upload())
+        second = pyenzyme_server.read_upload(make_upload())
+
+        assert len(count_reads) == 1
+        assert second is not first
+        assert second.dict(exclude={"log"}) == first.dict(exclude={"log"})
+
+        # Changes to a returned document must not reach the cache
+        second.name = "Changed"
+        third = pyenzyme_server.read_upload(make_upload())
+
+        assert len(count_reads) == 1
+        assert third.name == first.name
+
+    def test_large_upload_not_cached(self, empty_cache, count_reads, monkeypatch):
+        """Tests whether uploads above the byte limit are parsed every time"""
+
+        monkeypatch.setattr(pyenzyme_server, "DOCUMENT_CACHE_MAX_BYTES", 1)
+
+        pyenzyme_server.read_upload(make_upload())
+        pyenzyme_server.read_upload(make_upload())
+
+        assert len(count_reads) == 2
+        assert not pyenzyme_server.document_cache
+
+
+class TestExportData:
+    def test_export_data(self, empty_cache):
+        """Tests the batch data export of an uploaded document"""
+
+        from fastapi.testclient import TestClient
+
+        client = TestClient(pyenzyme_server.app)
+
+        with open(OMEX_FIXTURE, "rb") as file_handle:
+            response = client.post(
+                "/export_data",
+                data={
+                    "projections": '[{"species_ids": ["s0"]}, {"measurement_ids": "m0"}]'
+                },
+                files={"omex_archive": ("test_case.omex", file_handle)},
+            )
+
+        assert response.status_code == 200
+
+        reactants_only, full = response.json()
+
+        assert reactants_only["m0"]["data"] == {
+            "s0": [1.0, 1.0, 1.0, 1.0],
+            "time": [1.0, 2.0, 3.0, 4.0],
+        }
+        assert sorted(full["m0"]["data"]) == ["p0", "s0", "time"]
+        assert full["m0"]["initConc"]["p0"] == [10.0, "mmole / l"]
+
+    def test_single_projection(self, empty_cache):
+        """Tests whether a single projection object is exported as a one-entry list"""
+
+        from fastapi.testclient import TestClient
+
+        client = TestClient(pyenzyme_server.app)
+
+        with open(OMEX_FIXTURE, "rb") as file_handle:
+            response = client.post(
+                "/export_data",
+                data={"projections": '{"species_ids": "s0"}'},
+                files={"omex_archive": ("test_case.omex", file_handle)},
+            )
+
+        assert response.status_code == 200
+
+        (reactants_only,) = response.json()
+
+        assert sorted(reactants_only["m0"]["data"]) == ["s0", "time"]
+
+    def test_invalid_projections(self, empty_cache):
+        """Tests whether malformed projections are rejected"""
+
+        from fastapi.testclient import TestClient
+
+        client = TestClient(pyenzyme_server.app)
+
+        with open(OMEX_FIXTURE, "rb") as file_handle:
+            response = client.post(
+                "/export_data",
+                data={"projections": '{"species_ids": 1}'},
+                files={"omex_archive": ("test_case.omex", file_handle)},
+            )
+
+        assert response.status_code == 422
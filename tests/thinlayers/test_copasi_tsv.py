@@ -0,0 +1,27 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyenzymedepfix.thinlayers.TL_Copasi import ThinLayerCopasi
+
+
+@pytest.fixture
+def experiment_data():
+    return pd.DataFrame(
+        {
+            "s0": [0.1 + 0.2, np.nan, 1e-7],
+            "time": [0.0, 1.0, 2.0],
+            "init_s0": [10.0, np.nan, np.nan],
+        }
+    )
+
+
+class TestCopasiExperimentFiles:
+    def test_write_tsv(self, experiment_data, tmp_path):
+        """Tests the experiment file written for COPASI"""
+
+        path = tmp_path / "experiment.tsv"
+        ThinLayerCopasi._write_tsv(str(path), experiment_data)
+
+        assert path.read_text() == "s0\ttime\tinit_s0\n0.3\t0\t10\n\t1\t\n1e-07\t2\t\n"
+
@@ -0,0 +1,77 @@
+import pytest
+
+from collections import OrderedDict
+
+from pyenzymedepfix.enzymeml.core.enzymemldocument import EnzymeMLDocument
+from pyenzymedepfix.thinlayers import TL_Base
+from pyenzymedepfix.thinlayers.TL_Base import BaseThinLayer, load_enzmldoc
+
+
+@pytest.fixture
+def count_reads(monkeypatch):
+    monkeypatch.setattr(TL_Base, "_document_cache", OrderedDict())
+
+    calls = []
+    from_file = EnzymeMLDocument.fromFile
+
+    def counting_from_file(path):
+        calls.append(path)
+        return from_file(path)
+
+    monkeypatch.setattr(EnzymeMLDocument, "fromFile", counting_from_file)
+
+    return calls
+
+
+class ThinLayerDummy(BaseThinLayer):
+    def optimize(self):
+        pass
+
+    def write(self):
+        return self.enzmldoc
+
+
+class TestLoadEnzymeMLDocument:
+    def test_cached_copies(self, count_reads):
+        """Tests whether repeated loads parse once and return independent copies"""
+
+        first = load_enzmldoc("./tests/fixtures/test_case.omex")
+        second = load_enzmldoc("./tests/fixtures/test_case.omex")
+
+        assert len(count_reads) == 1
+        assert second is not first
+        assert second.dict(exclude={"log"}) == first.dict(exclude={"log"})
+
+        second.name = "Changed"
+        assert load_enzmldoc("./tests/fixtures/test_case.omex").name == first.name
+
+    def test_attached_files(self, enzmldoc, tmp_path, count_reads):
+        """Tests whether documents with attached files are parsed once per load and not cached"""
+
+        enzmldoc.addFile(filepath="./tests/fixtures/replicate_object.json")
+        enzmldoc.toFile(str(tmp_path), name="with_files")
+        path = str(tmp_path / "with_files.omex")
+
+        for _ in range(3):
+            assert load_enzmldoc(path).file_dict
+
+        assert len(count_reads) == 3
+        assert not TL_Base._document_cache
+
+    def test_passed_document(self, enzmldoc):
+        """Tests whether a passed document is copied and left unchanged"""
+
+        enzmldoc.addFile(filepath="./tests/fixtures/replicate_object.json")
+        handler = enzmldoc.file_dict["f0"]["handler"]
+        expected = enzmldoc.dict(exclude={"log", "file_dict"})
+
+        thin_layer = ThinLayerDummy(enzmldoc)
+
+        assert thin_layer.enzmldoc is not enzmldoc
+        assert thin_layer.enzmldoc.file_dict["f0"]["handler"] is not handler
+
+        thin_layer.enzmldoc.name = "Changed"
+        thin_layer.enzmldoc.file_dict["f0"]["handler"].read()
+
+        assert enzmldoc.dict(exclude={"log", "file_dict"}) == expected
+        assert handler.tell() == 0